@@ -0,0 +1,180 @@
+"""
+Helpers for authenticating requests to a `DurableMCP` server.
+"""
+
+import asyncio
+import httpx
+import jwt
+import time
+from log.log import get_logger
+from mcp.server.auth.provider import AccessToken, TokenVerifier
+from typing import Any, Sequence
+
+logger = get_logger(__name__)
+
+# Minimum number of seconds between attempts to fetch the key set,
+# whether the last attempt succeeded or failed, so that neither tokens
+# with bogus key IDs nor an unavailable JWKS endpoint can make us
+# hammer the endpoint.
+_MIN_REFETCH_SECONDS = 60.0
+
+
+class JWKSTokenVerifier(TokenVerifier):
+    """
+    `TokenVerifier` for JWT access tokens (RFC 9068) which verifies
+    signatures locally using the keys published at a JSON Web Key Set
+    (JWKS) URL.
+
+    The key set is fetched on first use and then cached for
+    `jwks_cache_seconds`, so verifying a token does not require any
+    network round trip to the authorization server. If refreshing the
+    key set fails the previously fetched keys continue to be used.
+
+    Example:
+        mcp = DurableMCP(
+            path="/mcp",
+            auth=AuthSettings(...),
+            token_verifier=JWKSTokenVerifier(
+                jwks_url="https://auth.example.com/.well-known/jwks.json",
+                issuer="https://auth.example.com",
+                audience="https://mcp.example.com",
+            ),
+        )
+    """
+
+    def __init__(
+        self,
+        *,
+        jwks_url: str,
+        issuer: str,
+        audience: str,
+        algorithms: Sequence[str] = ("RS256", ),
+        jwks_cache_seconds: float = 3600.0,
+    ):
+        self._jwks_url = jwks_url
+        self._issuer = issuer
+        self._audience = audience
+        self._algorithms = list(algorithms)
+        self._jwks_cache_seconds = jwks_cache_seconds
+        self._keys: dict[str, jwt.PyJWK] = {}
+        self._keys_fetched_at: float | None = None
+        self._fetch_attempted_at: float | None = None
+        # Held while refreshing so that concurrent callers wait for
+        # (and then use) the keys being fetched rather than being
+        # throttled into rejecting their tokens.
+        self._refresh_lock = asyncio.Lock()
+
+    async def verify_token(self, token: str) -> AccessToken | None:
+        try:
+            key_id = jwt.get_unverified_header(token).get("kid")
+
+            if key_id is None:
+                return None
+
+            key = await self._get_signing_key(key_id)
+
+            if key is None:
+                return None
+
+            claims: dict[str, Any] = jwt.decode(
+                token,
+                key=key.key,
+                algorithms=self._algorithms,
+                audience=self._audience,
+                issuer=self._issuer,
+                options={"require": ["exp", "iss", "aud"]},
+            )
+        except jwt.PyJWTError:
+            return None
+
+        # RFC 9068 requires `client_id`, but fall back to the OpenID
+        # Connect `azp` claim for providers that only include that.
+        client_id = claims.get("client_id") or claims.get("azp")
+
+        if not isinstance(client_id, str):
+            return None
+
+        return AccessToken(
+            token=token,
+            client_id=client_id,
+            scopes=_scopes(claims),
+            # RFC 7519 allows a non-integer `exp`.
+            expires_at=int(claims["exp"]),
+        )
+
+    async def _get_signing_key(self, key_id: str) -> jwt.PyJWK | None:
+        if self._should_refresh(key_id):
+            async with self._refresh_lock:
+                # Another caller may have refreshed while we waited.
+                if self._should_refresh(key_id):
+                    await self._refresh_keys()
+
+        return self._keys.get(key_id)
+
+    def _should_refresh(self, key_id: str) -> bool:
+        if self._fetch_attempted_at is None:
+            return True
+
+        now = time.monotonic()
+
+        if now - self._fetch_attempted_at < _MIN_REFETCH_SECONDS:
+            return False
+
+        if (
+            self._keys_fetched_at is None or
+            now - self._keys_fetched_at >= self._jwks_cache_seconds
+        ):
+            return True
+
+        # Keys might have been rotated since we last fetched.
+        return key_id not in self._keys
+
+    async def _refresh_keys(self) -> None:
+        try:
+            jwks = await self._fetch_jwks()
+            # `PyJWKSet` raises `AttributeError` rather than a
+            # `PyJWTError` for anything but a list of objects.
+            keys = jwks.get("keys") if isinstance(jwks, dict) else None
+            if (
+                not isinstance(keys, list) or
+                not all(isinstance(key, dict) for key in keys)
+            ):
+                raise ValueError("Expected a JSON object with a 'keys' list")
+            jwk_set = jwt.PyJWKSet.from_dict(jwks)
+        except (httpx.HTTPError, ValueError, jwt.PyJWKSetError) as e:
+            # Keep using the keys we already have, if any.
+            logger.warning(
+                f"Failed to fetch JWKS from '{self._jwks_url}': {e}"
+            )
+            return
+        finally:
+            # Only mark the attempt once it is done, callers arriving
+            # in the meantime wait on `_refresh_lock` instead.
+            self._fetch_attempted_at = time.monotonic()
+
+        self._keys = {
+            key.key_id: key
+            for key in jwk_set.keys
+            if key.key_id is not None and key.public_key_use in (None, "sig")
+        }
+        self._keys_fetched_at = time.monotonic()
+
+    async def _fetch_jwks(self) -> Any:
+        async with httpx.AsyncClient(
+            follow_redirects=True,
+            timeout=httpx.Timeout(10.0),
+        ) as client:
+            response = await client.get(self._jwks_url)
+            response.raise_for_status()
+            return response.json()
+
+
+def _scopes(claims: dict[str, Any]) -> list[str]:
+    """Returns the scopes from either a `scope` or `scp` claim."""
+    scope = claims.get("scope")
+    if isinstance(scope, str):
+        return scope.split()
+    scp = claims.get("scp")
+    if isinstance(scp, list):
+        return [str(s) for s in scp]
+    return []
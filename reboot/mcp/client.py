@@ -13,24 +13,40 @@ from mcp.server.streamable_http import (
     MCP_PROTOCOL_VERSION_HEADER,
     MCP_SESSION_ID_HEADER,
 )
-from typing import AsyncIterator, Any, Callable
+from typing import AsyncIterator, Any, Callable, cast
+
+# Defaults of `streamablehttp_client()`.
+_DEFAULT_TIMEOUT_SECONDS = 30.0
+_DEFAULT_SSE_READ_TIMEOUT_SECONDS = 300.0
 
 
 def create_mcp_http_client(
     headers: dict[str, str] | None = None,
     timeout: httpx.Timeout | None = None,
     auth: httpx.Auth | None = None,
+    limits: httpx.Limits | None = None,
 ) -> httpx.AsyncClient:
     """
     Almost identical implementation to
     `mcp.shared._httpx_utils.create_mcp_http_client`, but we've added
     a transport which does retries.
+
+    Pass `limits` to tune the connection pool, e.g., when the client
+    will be shared across multiple `connect()`/`reconnect()` calls.
+
+    Unlike the SDK, the default `timeout` allows reads to wait as long
+    as `streamablehttp_client()` does by default for server sent
+    events, so that the client can be passed as `http_client` to
+    `connect()`/`reconnect()` without long running calls timing out.
     """
     kwargs: dict[str, Any] = {
         "follow_redirects": True,
     }
 
-    kwargs["timeout"] = timeout or httpx.Timeout(30.0)
+    kwargs["timeout"] = timeout or httpx.Timeout(
+        _DEFAULT_TIMEOUT_SECONDS,
+        read=_DEFAULT_SSE_READ_TIMEOUT_SECONDS,
+    )
 
     if headers is not None:
         kwargs["headers"] = headers
@@ -38,18 +54,63 @@ def create_mcp_http_client(
     if auth is not None:
         kwargs["auth"] = auth
 
+    transport_kwargs: dict[str, Any] = {}
+
+    # NOTE: `httpx.AsyncClient` ignores `limits` when given an
+    # explicit `transport`, so they must be passed to the transport.
+    if limits is not None:
+        transport_kwargs["limits"] = limits
+
     return httpx.AsyncClient(
-        transport=httpx.AsyncHTTPTransport(retries=5),
+        transport=httpx.AsyncHTTPTransport(retries=5, **transport_kwargs),
         **kwargs,
     )
 
 
+def _httpx_client_factory(
+    *,
+    http_client: httpx.AsyncClient | None,
+    auth: httpx.Auth | None,
+) -> Callable[..., httpx.AsyncClient]:
+    """
+    Returns the `httpx_client_factory` for `streamablehttp_client()`.
+
+    If `http_client` is provided we hand it out without closing it
+    once the transport is done so that its connection pool can be
+    reused by the caller, e.g., across a `connect()` and `reconnect()`.
+    The arguments `streamablehttp_client()` calls the factory with are
+    then ignored, i.e., the client's own `timeout` is used, which must
+    allow for reads that wait on server sent events (see
+    `create_mcp_http_client()`).
+    """
+    if http_client is None:
+        return create_mcp_http_client
+
+    if auth is not None:
+        raise ValueError(
+            "Cannot specify both http_client and auth, configure auth "
+            "on the http_client instead"
+        )
+
+    # NOTE: `borrow()` returns an async context manager, not a client
+    # (hence the `cast()`). That only works because the pinned `mcp`
+    # SDK's `streamablehttp_client()` uses the factory exclusively as
+    # `async with factory(...) as client`. Revisit this when upgrading
+    # `mcp` in case it starts using the factory's result as a client.
+    @asynccontextmanager
+    async def borrow(**kwargs: Any) -> AsyncIterator[httpx.AsyncClient]:
+        yield http_client
+
+    return cast(Callable[..., httpx.AsyncClient], borrow)
+
+
 @asynccontextmanager
 async def connect(
     url: str,
     *,
     headers: dict[str, str] | None = None,
     auth: httpx.Auth | None = None,
+    http_client: httpx.AsyncClient | None = None,
     terminate_on_close: bool = True,
     elicitation_callback: ElicitationFnT | None = None,
     message_handler: MessageHandlerFnT | None = None,
@@ -59,7 +120,10 @@ async def connect(
         headers=headers,
         auth=auth,
         terminate_on_close=terminate_on_close,
-        httpx_client_factory=create_mcp_http_client,
+        httpx_client_factory=_httpx_client_factory(
+            http_client=http_client,
+            auth=auth,
+        ),
     ) as (read_stream, write_stream, get_session_id):
         async with mcp.ClientSession(
             read_stream,
@@ -88,6 +152,7 @@ async def reconnect(
     next_request_id: int,
     headers: dict[str, str] | None = None,
     auth: httpx.Auth | None = None,
+    http_client: httpx.AsyncClient | None = None,
     terminate_on_close: bool = True,
     elicitation_callback: ElicitationFnT | None = None,
     message_handler: MessageHandlerFnT | None = None,
@@ -103,7 +168,10 @@ async def reconnect(
         headers=all_headers,
         auth=auth,
         terminate_on_close=terminate_on_close,
-        httpx_client_factory=create_mcp_http_client,
+        httpx_client_factory=_httpx_client_factory(
+            http_client=http_client,
+            auth=auth,
+        ),
     ) as (read_stream, write_stream, get_session_id):
         async with mcp.ClientSession(
             read_stream,
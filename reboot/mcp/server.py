@@ -784,6 +784,21 @@ def _streamable_http_app(
     )
 
 
+@functools.cache
+def _elicitation_json_schema(
+    schema: type[ElicitSchemaModelT],
+) -> dict[str, Any]:
+    """
+    Returns the JSON schema to send for an elicitation with `schema`,
+    computed once per model since a model's schema never changes.
+
+    Raises if `schema` contains non-primitive types; failures aren't
+    cached, so an invalid schema fails loudly on every call.
+    """
+    _validate_elicitation_schema(schema)
+    return schema.model_json_schema()
+
+
 def _wrap_with_durable_context(fn: mcp.types.AnyFunction) -> mcp.types.AnyFunction:
     """
     Common wrapper that adds `DurableContext` to tools, resources, and prompts.
@@ -826,6 +841,10 @@ def _wrap_with_durable_context(fn: mcp.types.AnyFunction) -> mcp.types.AnyFuncti
 
     wrapper_signature = signature.replace(parameters=wrapper_parameters)
 
+    # Determine once, rather than on every call, whether or not `fn`
+    # needs to be awaited.
+    is_async_callable = fastmcp.tools.base._is_async_callable(fn)
+
     async def wrapper(
         ctx: fastmcp.Context,
         context: WorkflowContext,
@@ -1043,9 +1062,7 @@ def _wrap_with_durable_context(fn: mcp.types.AnyFunction) -> mcp.types.AnyFuncti
                 #
                 # Validate that schema only contains primitive types and
                 # fail loudly if not.
-                _validate_elicitation_schema(schema)
-
-                json_schema = schema.model_json_schema()
+                json_schema = _elicitation_json_schema(schema)
 
                 return await ctx.session.send_request(
                     mcp.types.ServerRequest(
@@ -1096,7 +1113,7 @@ def _wrap_with_durable_context(fn: mcp.types.AnyFunction) -> mcp.types.AnyFuncti
         bound.apply_defaults()
 
         try:
-            if fastmcp.tools.base._is_async_callable(fn):
+            if is_async_callable:
                 return await fn(**dict(bound.arguments))
 
             return fn(**dict(bound.arguments))
@@ -1186,6 +1203,29 @@ class StreamableHTTPASGIApp:
     ) -> None:
         request = Request(scope, receive)
 
+        # A GET without a session ID can't belong to any session, so
+        # reject it like the transport would but without first
+        # forwarding it and creating a transport (and connecting it)
+        # for a session that will never be initialized.
+        if (
+            request.method == "GET" and
+            request.headers.get(MCP_SESSION_ID_HEADER) is None
+        ):
+            response = Response(
+                mcp.types.JSONRPCError(
+                    jsonrpc="2.0",
+                    id="server-error",
+                    error=mcp.types.ErrorData(
+                        code=mcp.types.INVALID_REQUEST,
+                        message="Bad Request: Missing session ID",
+                    ),
+                ).model_dump_json(by_alias=True, exclude_none=True),
+                status_code=400,
+                media_type="application/json",
+            )
+            await response(scope, receive, send)
+            return
+
         if request.headers.get(STATE_REF_HEADER) is None:
             mcp_session_id = request.headers.get(MCP_SESSION_ID_HEADER)
 
@@ -0,0 +1,43 @@
+import mcp
+import unittest
+from contextlib import AbstractAsyncContextManager
+from reboot.aio.tests import Reboot
+from reboot.mcp.client import connect, reconnect
+from typing import Any
+
+
+class McpTestCase(unittest.IsolatedAsyncioTestCase):
+    """
+    Base class for tests of a `DurableMCP` server handling HTTP
+    requests at path "/mcp", running in a `Reboot` started fresh for
+    each test.
+    """
+
+    async def asyncSetUp(self) -> None:
+        self.rbt = Reboot()
+        await self.rbt.start()
+
+    async def asyncTearDown(self) -> None:
+        await self.rbt.stop()
+
+    def _mcp_url(self) -> str:
+        # Not cached, the URL may change after the application is
+        # brought back up with `self.rbt.up(revision=...)`.
+        return self.rbt.url() + "/mcp"
+
+    def _mcp_session(
+        self,
+        **kwargs: Any,
+    ) -> AbstractAsyncContextManager[tuple[mcp.ClientSession, str, str | int]]:
+        """
+        Connects a new MCP session that is not terminated on close, so
+        tests can later `_mcp_reconnect()` to it.
+        """
+        return connect(self._mcp_url(), terminate_on_close=False, **kwargs)
+
+    def _mcp_reconnect(
+        self,
+        **kwargs: Any,
+    ) -> AbstractAsyncContextManager[mcp.ClientSession]:
+        """Reconnects to an existing MCP session, see `reconnect()`."""
+        return reconnect(self._mcp_url(), **kwargs)
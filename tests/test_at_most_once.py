@@ -1,14 +1,16 @@
 import asyncio
+import contextlib
+import logging
 import unittest
 from mcp import types
 from mcp.shared.message import ClientMessageMetadata
 from mcp.shared.session import RequestResponder
 from reboot.aio.applications import Application
-from reboot.aio.tests import Reboot
 from reboot.aio.workflows import at_most_once
-from reboot.mcp.client import connect, reconnect
 from reboot.mcp.server import DurableContext, DurableMCP
-from reboot.std.collections.v1.sorted_map import SortedMap
+from tests._mcp_test_case import McpTestCase
+
+logger = logging.getLogger(__name__)
 
 LOGGING_MESSAGE = "Completed side-effect _idempotently_!"
 
@@ -56,14 +58,7 @@ async def finish() -> None:
 application: Application = mcp.application()
 
 
-class TestSomething(unittest.IsolatedAsyncioTestCase):
-
-    async def asyncSetUp(self) -> None:
-        self.rbt = Reboot()
-        await self.rbt.start()
-
-    async def asyncTearDown(self) -> None:
-        await self.rbt.stop()
+class TestSomething(McpTestCase):
 
     async def test_mcp(self) -> None:
         revision = await self.rbt.up(application)
@@ -81,16 +76,16 @@ class TestSomething(unittest.IsolatedAsyncioTestCase):
                         received_message_event.set()
 
         last_event_id = None
+        token_event = asyncio.Event()
 
-        async with connect(
-            self.rbt.url() + "/mcp",
-            terminate_on_close=False,
+        async with self._mcp_session(
             message_handler=message_handler,
         ) as (session, session_id, protocol_version):
 
             async def on_resumption_token_update(token: str) -> None:
                 nonlocal last_event_id
                 last_event_id = token
+                token_event.set()
 
             send_request_task = asyncio.create_task(
                 session.send_request(
@@ -113,23 +108,32 @@ class TestSomething(unittest.IsolatedAsyncioTestCase):
                 )
             )
 
-            await received_message_event.wait()
+            try:
+                await asyncio.wait_for(
+                    received_message_event.wait(),
+                    timeout=10.0,
+                )
+            except asyncio.TimeoutError:
+                self.fail("server never emitted LOGGING_MESSAGE")
 
-            while last_event_id == None:
-                await asyncio.sleep(0.01)
+            try:
+                await asyncio.wait_for(token_event.wait(), timeout=10.0)
+            except asyncio.TimeoutError:
+                self.fail("client never received a resumption token")
 
             send_request_task.cancel()
-            try:
+            with contextlib.suppress(asyncio.CancelledError):
                 await send_request_task
-            except:
-                pass
 
-        print(f"Rebooting application running at {self.rbt.url()}...")
+        logger.debug(
+            "Rebooting application running at %s...",
+            self.rbt.url(),
+        )
 
         await self.rbt.down()
         await self.rbt.up(revision=revision)
 
-        print(f"... application now at {self.rbt.url()}")
+        logger.debug("... application now at %s", self.rbt.url())
 
         async def message_handler_expecting_no_messages(
             message: RequestResponder[
@@ -138,8 +142,7 @@ class TestSomething(unittest.IsolatedAsyncioTestCase):
         ) -> None:
             raise RuntimeError(f"Not expecting to get a message, got: {message}")
 
-        async with reconnect(
-            self.rbt.url() + "/mcp",
+        async with self._mcp_reconnect(
             session_id=session_id,
             protocol_version=protocol_version,
             # MCP bug: need to start using the "next" request ID in
@@ -183,7 +186,7 @@ class TestSomething(unittest.IsolatedAsyncioTestCase):
                 ),
             )
 
-            print(result)
+            logger.debug("Result: %s", result)
 
 
 if __name__ == '__main__':
@@ -1,33 +1,37 @@
-import asyncio
 import httpx
+import logging
 import unittest
-from mcp import types
 from mcp.server.auth.provider import AccessToken, TokenVerifier
 from mcp.server.auth.settings import AuthSettings
 from pydantic import AnyHttpUrl
 from reboot.aio.applications import Application
-from reboot.aio.tests import Reboot
-from reboot.mcp.client import connect, reconnect
 from reboot.mcp.server import DurableMCP
+from tests._mcp_test_case import McpTestCase
 from typing import AsyncGenerator
 
+logger = logging.getLogger(__name__)
+
 
 class SimpleTokenVerifier(TokenVerifier):
     """Simple token verifier for testing (server-side)."""
 
     def __init__(self):
-        self.calls: list[str | None] = []
+        self._cache: dict[str, AccessToken] = {}
 
     async def verify_token(self, token: str) -> AccessToken | None:
-        # Track all verification attempts.
-        self.calls.append(token)
+        # Every request carries the bearer token, so reuse the
+        # `AccessToken` we already built for it.
+        if token in self._cache:
+            return self._cache[token]
         # Accept any non-empty token for testing.
         if token:
-            return AccessToken(
+            access_token = AccessToken(
                 token=token,
                 client_id="test_client",
                 scopes=["read"],
             )
+            self._cache[token] = access_token
+            return access_token
         return None
 
 
@@ -36,15 +40,16 @@ class SimpleAuth(httpx.Auth):
 
     def __init__(self, token: str):
         self.token = token
+        self._authorization = f"Bearer {token}"
 
     async def async_auth_flow(
         self, request: httpx.Request
     ) -> AsyncGenerator[httpx.Request, httpx.Response]:
         # Add Bearer token to outgoing requests.
-        request.headers["Authorization"] = f"Bearer {self.token}"
+        request.headers["Authorization"] = self._authorization
         yield request
 
-# Module-level token verifier to track verification calls.
+# Module-level token verifier.
 token_verifier = SimpleTokenVerifier()
 
 # `DurableMCP` server which will handle HTTP requests at path "/mcp".
@@ -139,39 +144,32 @@ class TestAuthBasic(unittest.TestCase):
         assert mcp._token_verifier is None
 
 
-class TestAuthIntegration(unittest.IsolatedAsyncioTestCase):
+class TestAuthIntegration(McpTestCase):
     """Integration test that auth actually works end-to-end."""
 
-    async def asyncSetUp(self) -> None:
-        self.rbt = Reboot()
-        await self.rbt.start()
-
-    async def asyncTearDown(self) -> None:
-        await self.rbt.stop()
-
     async def test_auth_with_reconnect(self) -> None:
         """Test that auth works with durability/reconnect (positive case)."""
         revision = await self.rbt.up(application)
 
         auth = SimpleAuth("test_token")
 
-        async with connect(
-            self.rbt.url() + "/mcp",
+        async with self._mcp_session(
             auth=auth,
-            terminate_on_close=False,
         ) as (session, session_id, protocol_version):
             result = await session.call_tool("add", arguments={"a": 5, "b": 3})
             self.assertFalse(result.isError)
 
-        print(f"Rebooting application running at {self.rbt.url()}...")
+        logger.debug(
+            "Rebooting application running at %s...",
+            self.rbt.url(),
+        )
 
         await self.rbt.down()
         await self.rbt.up(revision=revision)
 
-        print(f"... application now at {self.rbt.url()}")
+        logger.debug("... application now at %s", self.rbt.url())
 
-        async with reconnect(
-            self.rbt.url() + "/mcp",
+        async with self._mcp_reconnect(
             session_id=session_id,
             protocol_version=protocol_version,
             # MCP bug: need to start using the "next" request ID in
@@ -189,10 +187,11 @@ class TestAuthIntegration(unittest.IsolatedAsyncioTestCase):
 
         # Connect without `auth` should fail.
         with self.assertRaises(Exception):
-            async with connect(
-                self.rbt.url() + "/mcp",
-                terminate_on_close=False,
-            ) as (session, session_id, protocol_version):
+            async with self._mcp_session() as (
+                session,
+                session_id,
+                protocol_version,
+            ):
                 await session.call_tool("add", arguments={"a": 5, "b": 3})
 
 
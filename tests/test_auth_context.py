@@ -1,29 +1,48 @@
 import asyncio
 import httpx
+import logging
 import unittest
-from mcp import types
 from mcp.server.auth.middleware.auth_context import get_access_token
 from mcp.server.auth.provider import AccessToken, TokenVerifier
 from mcp.server.auth.settings import AuthSettings
 from pydantic import AnyHttpUrl
 from reboot.aio.applications import Application
-from reboot.aio.tests import Reboot
-from reboot.mcp.client import connect, reconnect
 from reboot.mcp.server import DurableMCP
+from tests._mcp_test_case import McpTestCase
 from typing import AsyncGenerator
 
+logger = logging.getLogger(__name__)
+
+
+def format_expected(token: str) -> str:
+    """Expected `get_token_info` output for a `SimpleTokenVerifier` token."""
+    return f"token={token},client_id=test_client,scopes=read,write"
+
+
+EXPECTED_TOKEN_INFO_123 = format_expected("my_test_token_123")
+EXPECTED_TOKEN_INFO_456 = format_expected("my_test_token_456")
+
 
 class SimpleTokenVerifier(TokenVerifier):
     """Simple token verifier for testing (server-side)."""
 
+    def __init__(self):
+        self._cache: dict[str, AccessToken] = {}
+
     async def verify_token(self, token: str) -> AccessToken | None:
+        # Every request carries the bearer token, so reuse the
+        # `AccessToken` we already built for it.
+        if token in self._cache:
+            return self._cache[token]
         # Accept any non-empty token for testing.
         if token:
-            return AccessToken(
+            access_token = AccessToken(
                 token=token,
                 client_id="test_client",
                 scopes=["read", "write"],
             )
+            self._cache[token] = access_token
+            return access_token
         return None
 
 
@@ -32,12 +51,13 @@ class SimpleAuth(httpx.Auth):
 
     def __init__(self, token: str):
         self.token = token
+        self._authorization = f"Bearer {token}"
 
     async def async_auth_flow(
         self, request: httpx.Request
     ) -> AsyncGenerator[httpx.Request, httpx.Response]:
         # Add Bearer token to outgoing requests.
-        request.headers["Authorization"] = f"Bearer {self.token}"
+        request.headers["Authorization"] = self._authorization
         yield request
 
 
@@ -99,69 +119,36 @@ async def specific_client_tool(allowed_client: str) -> str:
 application: Application = mcp.application()
 
 
-class TestAuthContext(unittest.IsolatedAsyncioTestCase):
+class TestAuthContext(McpTestCase):
     """Test that `get_access_token()` works correctly in tools."""
 
-    async def asyncSetUp(self) -> None:
-        self.rbt = Reboot()
-        await self.rbt.start()
-
-    async def asyncTearDown(self) -> None:
-        await self.rbt.stop()
-
-    async def test_get_access_token_in_tool(self) -> None:
-        """Test that `get_access_token()` returns correct token in tool."""
-        await self.rbt.up(application)
-
-        auth = SimpleAuth("my_test_token_123")
-
-        async with connect(
-            self.rbt.url() + "/mcp",
-            auth=auth,
-            terminate_on_close=False,
-        ) as (session, session_id, protocol_version):
-            result = await session.call_tool(
-                "get_token_info", arguments={}
-            )
-            self.assertFalse(result.isError)
-
-            # Extract the content from the result.
-            content = result.content[0].text
-            self.assertEqual(
-                content,
-                "token=my_test_token_123,client_id=test_client,scopes=read,write"
-            )
-
     async def test_get_access_token_survives_reboot(self) -> None:
         """Test that `get_access_token()` works after reboot."""
         revision = await self.rbt.up(application)
 
         auth = SimpleAuth("my_test_token_456")
 
-        async with connect(
-            self.rbt.url() + "/mcp",
+        async with self._mcp_session(
             auth=auth,
-            terminate_on_close=False,
         ) as (session, session_id, protocol_version):
             result = await session.call_tool(
                 "get_token_info", arguments={}
             )
             self.assertFalse(result.isError)
             content = result.content[0].text
-            self.assertEqual(
-                content,
-                "token=my_test_token_456,client_id=test_client,scopes=read,write"
-            )
+            self.assertEqual(content, EXPECTED_TOKEN_INFO_456)
 
-        print(f"Rebooting application running at {self.rbt.url()}...")
+        logger.debug(
+            "Rebooting application running at %s...",
+            self.rbt.url(),
+        )
 
         await self.rbt.down()
         await self.rbt.up(revision=revision)
 
-        print(f"... application now at {self.rbt.url()}")
+        logger.debug("... application now at %s", self.rbt.url())
 
-        async with reconnect(
-            self.rbt.url() + "/mcp",
+        async with self._mcp_reconnect(
             session_id=session_id,
             protocol_version=protocol_version,
             # MCP bug: need to start using the "next" request ID in
@@ -175,77 +162,81 @@ class TestAuthContext(unittest.IsolatedAsyncioTestCase):
             )
             self.assertFalse(result.isError)
             content = result.content[0].text
-            self.assertEqual(
-                content,
-                "token=my_test_token_456,client_id=test_client,scopes=read,write"
-            )
+            self.assertEqual(content, EXPECTED_TOKEN_INFO_456)
 
-    async def test_scope_based_access_denial(self) -> None:
-        """Test that tools can deny access based on missing scopes."""
-        await self.rbt.up(application)
-
-        auth = SimpleAuth("test_token")
-
-        async with connect(
-            self.rbt.url() + "/mcp",
-            auth=auth,
-            terminate_on_close=False,
-        ) as (session, session_id, protocol_version):
-            # Call admin_only_tool without admin scope.
-            result = await session.call_tool("admin_only_tool", arguments={})
-
-            # Should return an error.
-            self.assertTrue(result.isError)
-            # Check the error message contains information about missing scope.
-            error_text = result.content[0].text
-            self.assertIn("admin", error_text)
-            self.assertIn("read", error_text)
-            self.assertIn("write", error_text)
-
-    async def test_client_based_access_denial(self) -> None:
-        """Test that tools can deny access based on client_id."""
+    async def test_access_matrix(self) -> None:
+        """Test token, scope, and client checks from a single session."""
         await self.rbt.up(application)
 
-        auth = SimpleAuth("test_token")
+        auth = SimpleAuth("my_test_token_123")
 
-        async with connect(
-            self.rbt.url() + "/mcp",
+        async with self._mcp_session(
             auth=auth,
-            terminate_on_close=False,
         ) as (session, session_id, protocol_version):
-            # Call specific_client_tool with wrong client.
-            result = await session.call_tool(
-                "specific_client_tool",
-                arguments={"allowed_client": "different_client"}
+            # Each case is a tool call, whether it should be an error,
+            # and text its result must contain.
+            cases: list[tuple[str, dict[str, str], bool, list[str]]] = [
+                # `get_token_info()` sees the token used by the client.
+                ("get_token_info", {}, False, [EXPECTED_TOKEN_INFO_123]),
+                # Missing 'admin' scope is denied and the error mentions
+                # both the required and the granted scopes.
+                ("admin_only_tool", {}, True, ["admin", "read", "write"]),
+                # Wrong client is denied and the error mentions ours.
+                (
+                    "specific_client_tool",
+                    {"allowed_client": "different_client"},
+                    True,
+                    ["test_client"],
+                ),
+                # Correct client is granted.
+                (
+                    "specific_client_tool",
+                    {"allowed_client": "test_client"},
+                    False,
+                    ["Access granted for test_client"],
+                ),
+            ]
+
+            # None of these calls depend on each other, so send them
+            # concurrently over the same session.
+            results = await asyncio.gather(
+                *(
+                    session.call_tool(name, arguments=arguments)
+                    for name, arguments, _, _ in cases
+                )
             )
 
-            # Should return an error.
-            self.assertTrue(result.isError)
-            # Check the error message contains the denied client_id.
-            error_text = result.content[0].text
-            self.assertIn("test_client", error_text)
+            for (name, arguments, is_error, needles), result in zip(
+                cases, results
+            ):
+                with self.subTest(tool=name, arguments=arguments):
+                    self.assertEqual(result.isError, is_error)
+                    for needle in needles:
+                        self.assertIn(needle, result.content[0].text)
 
-    async def test_client_based_access_granted(self) -> None:
-        """Test that tools grant access for correct client_id."""
+    async def test_concurrent_sessions_see_own_token(self) -> None:
+        """Test that concurrent sessions each see their own access token."""
         await self.rbt.up(application)
 
-        auth = SimpleAuth("test_token")
-
-        async with connect(
-            self.rbt.url() + "/mcp",
-            auth=auth,
-            terminate_on_close=False,
-        ) as (session, session_id, protocol_version):
-            # Call specific_client_tool with correct client.
-            result = await session.call_tool(
-                "specific_client_tool",
-                arguments={"allowed_client": "test_client"}
-            )
+        async def get_token_info(token: str) -> str:
+            async with self._mcp_session(
+                auth=SimpleAuth(token),
+            ) as (session, session_id, protocol_version):
+                result = await session.call_tool(
+                    "get_token_info", arguments={}
+                )
+                self.assertFalse(result.isError)
+                return result.content[0].text
+
+        # Run both sessions at the same time so that requests
+        # authenticated with different tokens are in flight together.
+        first, second = await asyncio.gather(
+            get_token_info("my_test_token_123"),
+            get_token_info("my_test_token_456"),
+        )
 
-            # Should succeed.
-            self.assertFalse(result.isError)
-            content = result.content[0].text
-            self.assertEqual(content, "Access granted for test_client")
+        self.assertEqual(first, EXPECTED_TOKEN_INFO_123)
+        self.assertEqual(second, EXPECTED_TOKEN_INFO_456)
 
 
 if __name__ == "__main__":
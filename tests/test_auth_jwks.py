@@ -0,0 +1,221 @@
+import asyncio
+import httpx
+import json
+import jwt
+import time
+import unittest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from reboot.mcp.auth import JWKSTokenVerifier
+from typing import Any
+
+ISSUER = "https://auth.example.com"
+AUDIENCE = "https://mcp.example.com"
+KEY_ID = "test-key"
+
+
+class StaticJWKSTokenVerifier(JWKSTokenVerifier):
+    """`JWKSTokenVerifier` serving its key set from memory for testing."""
+
+    def __init__(self, jwks: Any):
+        super().__init__(
+            jwks_url=f"{ISSUER}/.well-known/jwks.json",
+            issuer=ISSUER,
+            audience=AUDIENCE,
+        )
+        self.jwks = jwks
+        self.error: Exception | None = None
+        self.delay = 0.0
+        self.fetches = 0
+
+    async def _fetch_jwks(self) -> Any:
+        self.fetches += 1
+        if self.delay > 0:
+            await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.jwks
+
+    def age(self, seconds: float) -> None:
+        """Pretends the last fetch happened `seconds` earlier."""
+        assert self._fetch_attempted_at is not None
+        self._fetch_attempted_at -= seconds
+        if self._keys_fetched_at is not None:
+            self._keys_fetched_at -= seconds
+
+
+def generate_key() -> rsa.RSAPrivateKey:
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def jwks_for(key: rsa.RSAPrivateKey, kid: str = KEY_ID) -> dict[str, Any]:
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(key.public_key()))
+    jwk.update({"kid": kid, "use": "sig", "alg": "RS256"})
+    return {"keys": [jwk]}
+
+
+def sign(
+    key: rsa.RSAPrivateKey,
+    *,
+    kid: str = KEY_ID,
+    **overrides: Any,
+) -> str:
+    claims: dict[str, Any] = {
+        "iss": ISSUER,
+        "aud": AUDIENCE,
+        "sub": "user",
+        "client_id": "test_client",
+        "scope": "read write",
+        "exp": int(time.time()) + 60,
+    }
+    claims.update(overrides)
+    return jwt.encode(claims, key, algorithm="RS256", headers={"kid": kid})
+
+
+class TestJWKSTokenVerifier(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.key = generate_key()
+        self.verifier = StaticJWKSTokenVerifier(jwks_for(self.key))
+
+    async def test_valid_token(self) -> None:
+        token = sign(self.key)
+
+        access_token = await self.verifier.verify_token(token)
+
+        assert access_token is not None
+        self.assertEqual(access_token.token, token)
+        self.assertEqual(access_token.client_id, "test_client")
+        self.assertEqual(access_token.scopes, ["read", "write"])
+
+    async def test_fractional_expiry(self) -> None:
+        exp = time.time() + 60.5
+        token = sign(self.key, exp=exp)
+
+        access_token = await self.verifier.verify_token(token)
+
+        assert access_token is not None
+        self.assertEqual(access_token.expires_at, int(exp))
+
+    async def test_key_set_is_cached(self) -> None:
+        for _ in range(3):
+            self.assertIsNotNone(
+                await self.verifier.verify_token(sign(self.key))
+            )
+
+        self.assertEqual(self.verifier.fetches, 1)
+
+    async def test_rejects_invalid_tokens(self) -> None:
+        cases = {
+            "expired": sign(self.key, exp=int(time.time()) - 60),
+            "wrong audience": sign(self.key, aud="https://other.example.com"),
+            "wrong issuer": sign(self.key, iss="https://other.example.com"),
+            "wrong signing key": sign(generate_key()),
+            "unknown key ID": sign(self.key, kid="unknown-key"),
+            "missing client_id": sign(self.key, client_id=None),
+            "not a JWT": "not-a-jwt",
+        }
+
+        for name, token in cases.items():
+            with self.subTest(name):
+                self.assertIsNone(await self.verifier.verify_token(token))
+
+    async def test_unknown_key_id_does_not_refetch_immediately(self) -> None:
+        self.assertIsNotNone(await self.verifier.verify_token(sign(self.key)))
+
+        self.assertIsNone(
+            await self.verifier.verify_token(sign(self.key, kid="unknown-key"))
+        )
+
+        self.assertEqual(self.verifier.fetches, 1)
+
+    async def test_refreshes_expired_key_set(self) -> None:
+        self.assertIsNotNone(await self.verifier.verify_token(sign(self.key)))
+
+        # Rotate the key and expire the cache.
+        new_key = generate_key()
+        self.verifier.jwks = jwks_for(new_key, kid="new-key")
+        self.verifier.age(3600.0)
+
+        self.assertIsNotNone(
+            await self.verifier.verify_token(sign(new_key, kid="new-key"))
+        )
+        self.assertEqual(self.verifier.fetches, 2)
+
+    async def test_fetch_failure_is_throttled(self) -> None:
+        self.verifier.error = httpx.ConnectError("JWKS unavailable")
+
+        for _ in range(3):
+            self.assertIsNone(
+                await self.verifier.verify_token(sign(self.key))
+            )
+
+        self.assertEqual(self.verifier.fetches, 1)
+
+        # Once the throttle has passed we try again.
+        self.verifier.error = None
+        self.verifier.age(60.0)
+
+        self.assertIsNotNone(await self.verifier.verify_token(sign(self.key)))
+        self.assertEqual(self.verifier.fetches, 2)
+
+    async def test_keeps_cached_keys_when_refresh_fails(self) -> None:
+        self.assertIsNotNone(await self.verifier.verify_token(sign(self.key)))
+
+        self.verifier.error = httpx.ConnectError("JWKS unavailable")
+        self.verifier.age(3600.0)
+
+        self.assertIsNotNone(await self.verifier.verify_token(sign(self.key)))
+        self.assertIsNotNone(await self.verifier.verify_token(sign(self.key)))
+        self.assertEqual(self.verifier.fetches, 2)
+
+    async def test_invalid_key_sets_are_throttled(self) -> None:
+        cases = {
+            "empty": {"keys": []},
+            "missing keys": {},
+            "not an object": [1, 2],
+            "keys not a list": {"keys": 5},
+            "key not an object": {"keys": ["key"]},
+        }
+
+        for name, jwks in cases.items():
+            with self.subTest(name):
+                verifier = StaticJWKSTokenVerifier(jwks)
+
+                for _ in range(3):
+                    self.assertIsNone(
+                        await verifier.verify_token(sign(self.key))
+                    )
+
+                self.assertEqual(verifier.fetches, 1)
+
+    async def test_concurrent_cold_start(self) -> None:
+        self.verifier.delay = 0.05
+
+        results = await asyncio.gather(
+            *(self.verifier.verify_token(sign(self.key)) for _ in range(5))
+        )
+
+        self.assertTrue(all(result is not None for result in results))
+        self.assertEqual(self.verifier.fetches, 1)
+
+    async def test_concurrent_rotation(self) -> None:
+        self.assertIsNotNone(await self.verifier.verify_token(sign(self.key)))
+
+        new_key = generate_key()
+        self.verifier.jwks = jwks_for(new_key, kid="new-key")
+        self.verifier.age(60.0)
+        self.verifier.delay = 0.05
+
+        results = await asyncio.gather(
+            *(
+                self.verifier.verify_token(sign(new_key, kid="new-key"))
+                for _ in range(5)
+            )
+        )
+
+        self.assertTrue(all(result is not None for result in results))
+        self.assertEqual(self.verifier.fetches, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import httpx
+import unittest
+from reboot.aio.applications import Application
+from reboot.mcp.client import _httpx_client_factory, create_mcp_http_client
+from reboot.mcp.server import DurableMCP
+from tests._mcp_test_case import McpTestCase
+
+# `DurableMCP` server which will handle HTTP requests at path "/mcp".
+mcp = DurableMCP(path="/mcp")
+
+
+@mcp.tool()
+def add(a: int, b: int) -> int:
+    """Add two numbers."""
+    return a + b
+
+
+# Reboot application that runs everything necessary for `DurableMCP`.
+application: Application = mcp.application()
+
+
+class TestHttpClient(unittest.IsolatedAsyncioTestCase):
+
+    async def test_factory_without_http_client(self) -> None:
+        self.assertIs(
+            _httpx_client_factory(http_client=None, auth=None),
+            create_mcp_http_client,
+        )
+
+    async def test_factory_rejects_http_client_and_auth(self) -> None:
+        async with create_mcp_http_client() as http_client:
+            with self.assertRaises(ValueError):
+                _httpx_client_factory(
+                    http_client=http_client,
+                    auth=httpx.BasicAuth("user", "password"),
+                )
+
+    async def test_factory_borrows_http_client(self) -> None:
+        async with create_mcp_http_client() as http_client:
+            factory = _httpx_client_factory(
+                http_client=http_client,
+                auth=None,
+            )
+
+            # `streamablehttp_client()` calls the factory with its own
+            # arguments, which are ignored in favor of the client's.
+            async with factory(
+                headers={"x-test": "test"},
+                timeout=httpx.Timeout(1.0),
+                auth=None,
+            ) as borrowed:
+                self.assertIs(borrowed, http_client)
+
+            self.assertFalse(http_client.is_closed)
+            self.assertEqual(http_client.timeout.read, 300.0)
+
+    async def test_default_timeout_allows_long_reads(self) -> None:
+        async with create_mcp_http_client() as http_client:
+            self.assertEqual(http_client.timeout.connect, 30.0)
+            self.assertEqual(http_client.timeout.read, 300.0)
+
+
+class TestConnectWithHttpClient(McpTestCase):
+
+    async def test_connect_and_reconnect(self) -> None:
+        await self.rbt.up(application)
+
+        async with create_mcp_http_client(
+            limits=httpx.Limits(
+                max_keepalive_connections=5,
+                keepalive_expiry=30,
+            ),
+        ) as http_client:
+            # `limits` must reach the connection pool, which
+            # `httpx.AsyncClient` would ignore if passed to it directly
+            # together with a `transport`.
+            pool = http_client._transport._pool
+            self.assertEqual(pool._max_keepalive_connections, 5)
+            self.assertEqual(pool._keepalive_expiry, 30)
+
+            async with self._mcp_session(http_client=http_client) as (
+                session,
+                session_id,
+                protocol_version,
+            ):
+                result = await session.call_tool(
+                    "add", arguments={"a": 5, "b": 3}
+                )
+                self.assertFalse(result.isError)
+
+            self.assertFalse(http_client.is_closed)
+
+            async with self._mcp_reconnect(
+                session_id=session_id,
+                protocol_version=protocol_version,
+                # MCP bug: need to start using the "next" request ID in
+                # the session as required by the spec:
+                # modelcontextprotocol.io/specification/2025-06-18/basic#requests
+                next_request_id=session._request_id,
+                http_client=http_client,
+            ) as session:
+                result = await session.call_tool(
+                    "add", arguments={"a": 1, "b": 2}
+                )
+                self.assertFalse(result.isError)
+
+            self.assertFalse(http_client.is_closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,16 @@
 import asyncio
+import contextlib
+import logging
 import unittest
 from mcp import ClientSession, types
 from mcp.shared.context import RequestContext
 from mcp.shared.message import ClientMessageMetadata
 from pydantic import BaseModel, Field
 from reboot.aio.applications import Application
-from reboot.aio.tests import Reboot
-from reboot.mcp.client import connect, reconnect
 from reboot.mcp.server import DurableContext, DurableMCP
+from tests._mcp_test_case import McpTestCase
+
+logger = logging.getLogger(__name__)
 
 # `DurableMCP` server which will handle HTTP requests at path "/mcp".
 mcp = DurableMCP(path="/mcp")
@@ -51,14 +54,7 @@ async def book_table(
 application: Application = mcp.application()
 
 
-class TestSomething(unittest.IsolatedAsyncioTestCase):
-
-    async def asyncSetUp(self) -> None:
-        self.rbt = Reboot()
-        await self.rbt.start()
-
-    async def asyncTearDown(self) -> None:
-        await self.rbt.stop()
+class TestSomething(McpTestCase):
 
     async def test_mcp(self) -> None:
         revision = await self.rbt.up(application)
@@ -72,19 +68,19 @@ class TestSomething(unittest.IsolatedAsyncioTestCase):
             assert "No tables available" in params.message
             elicitation_event.set()
             # Wait until we get cancelled because of the reboot.
-            await asyncio.Event().wait()
+            await asyncio.get_running_loop().create_future()
 
         last_event_id = None
+        token_event = asyncio.Event()
 
-        async with connect(
-            self.rbt.url() + "/mcp",
-            terminate_on_close=False,
+        async with self._mcp_session(
             elicitation_callback=elicitation_callback_before_reboot,
         ) as (session, session_id, protocol_version):
 
             async def on_resumption_token_update(token: str) -> None:
                 nonlocal last_event_id
                 last_event_id = token
+                token_event.set()
 
             send_request_task = asyncio.create_task(
                 session.send_request(
@@ -110,21 +106,21 @@ class TestSomething(unittest.IsolatedAsyncioTestCase):
 
             await elicitation_event.wait()
 
-            while last_event_id == None:
-                await asyncio.sleep(0.01)
+            await token_event.wait()
 
             send_request_task.cancel()
-            try:
+            with contextlib.suppress(asyncio.CancelledError):
                 await send_request_task
-            except:
-                pass
 
-        print(f"Rebooting application running at {self.rbt.url()}...")
+        logger.debug(
+            "Rebooting application running at %s...",
+            self.rbt.url(),
+        )
 
         await self.rbt.down()
         await self.rbt.up(revision=revision)
 
-        print(f"... application now at {self.rbt.url()}")
+        logger.debug("... application now at %s", self.rbt.url())
 
         async def elicitation_callback_after_reboot(
             context: RequestContext[ClientSession, None],
@@ -137,8 +133,7 @@ class TestSomething(unittest.IsolatedAsyncioTestCase):
                 content={"checkAlternative": True, "alternativeDate": "2024-12-26"},
             )
 
-        async with reconnect(
-            self.rbt.url() + "/mcp",
+        async with self._mcp_reconnect(
             session_id=session_id,
             protocol_version=protocol_version,
             # MCP bug: in this case we should specify that the request
@@ -170,7 +165,7 @@ class TestSomething(unittest.IsolatedAsyncioTestCase):
                 ),
             )
 
-            print(result)
+            logger.debug("Result: %s", result)
 
 
 if __name__ == '__main__':
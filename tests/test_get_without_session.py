@@ -0,0 +1,44 @@
+import asyncio
+import httpx
+import unittest
+from reboot.aio.applications import Application
+from reboot.mcp.server import DurableMCP
+from tests._mcp_test_case import McpTestCase
+
+# `DurableMCP` server which will handle HTTP requests at path "/mcp".
+mcp = DurableMCP(path="/mcp")
+
+
+@mcp.tool()
+def add(a: int, b: int) -> int:
+    """Add two numbers."""
+    return a + b
+
+
+# Reboot application that runs everything necessary for `DurableMCP`.
+application: Application = mcp.application()
+
+
+class TestGetWithoutSession(McpTestCase):
+
+    async def test_get_without_session_id(self) -> None:
+        await self.rbt.up(application)
+
+        async with httpx.AsyncClient() as client:
+            response = await asyncio.wait_for(
+                client.get(
+                    self._mcp_url(),
+                    headers={"accept": "text/event-stream"},
+                ),
+                timeout=5,
+            )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json()["error"]["message"],
+            "Bad Request: Missing session ID",
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,12 +1,15 @@
 import asyncio
+import contextlib
+import logging
 import unittest
 from mcp import types
 from mcp.shared.message import ClientMessageMetadata
 from reboot.aio.applications import Application
-from reboot.aio.tests import Reboot
-from reboot.mcp.client import connect, reconnect
 from reboot.mcp.server import DurableContext, DurableMCP
 from reboot.std.collections.v1.sorted_map import SortedMap
+from tests._mcp_test_case import McpTestCase
+
+logger = logging.getLogger(__name__)
 
 finish_event = asyncio.Event()
 
@@ -37,14 +40,7 @@ async def finish() -> None:
 application: Application = mcp.application()
 
 
-class TestSomething(unittest.IsolatedAsyncioTestCase):
-
-    async def asyncSetUp(self) -> None:
-        self.rbt = Reboot()
-        await self.rbt.start()
-
-    async def asyncTearDown(self) -> None:
-        await self.rbt.stop()
+class TestSomething(McpTestCase):
 
     async def test_mcp(self) -> None:
         revision = await self.rbt.up(application)
@@ -59,15 +55,18 @@ class TestSomething(unittest.IsolatedAsyncioTestCase):
             report_progress_event.set()
 
         last_event_id = None
+        token_event = asyncio.Event()
 
-        async with connect(
-            self.rbt.url() + "/mcp",
-            terminate_on_close=False,
-        ) as (session, session_id, protocol_version):
+        async with self._mcp_session() as (
+            session,
+            session_id,
+            protocol_version,
+        ):
 
             async def on_resumption_token_update(token: str) -> None:
                 nonlocal last_event_id
                 last_event_id = token
+                token_event.set()
 
             send_request_task = asyncio.create_task(
                 session.send_request(
@@ -93,24 +92,23 @@ class TestSomething(unittest.IsolatedAsyncioTestCase):
 
             await report_progress_event.wait()
 
-            while last_event_id == None:
-                await asyncio.sleep(0.01)
+            await token_event.wait()
 
             send_request_task.cancel()
-            try:
+            with contextlib.suppress(asyncio.CancelledError):
                 await send_request_task
-            except:
-                pass
 
-        print(f"Rebooting application running at {self.rbt.url()}...")
+        logger.debug(
+            "Rebooting application running at %s...",
+            self.rbt.url(),
+        )
 
         await self.rbt.down()
         await self.rbt.up(revision=revision)
 
-        print(f"... application now at {self.rbt.url()}")
+        logger.debug("... application now at %s", self.rbt.url())
 
-        async with reconnect(
-            self.rbt.url() + "/mcp",
+        async with self._mcp_reconnect(
             session_id=session_id,
             protocol_version=protocol_version,
             # MCP bug: need to start using the "next" request ID in
@@ -153,7 +151,7 @@ class TestSomething(unittest.IsolatedAsyncioTestCase):
                 ),
             )
 
-            print(result)
+            logger.debug("Result: %s", result)
 
             context = self.rbt.create_external_context(
                 name=self.id(),
@@ -161,7 +159,7 @@ class TestSomething(unittest.IsolatedAsyncioTestCase):
             )
 
             response = await SortedMap.ref("adds").range(context, limit=2)
-            print(response)
+            logger.debug("Response: %s", response)
 
 
 if __name__ == '__main__':
@@ -1,13 +1,16 @@
 import asyncio
+import contextlib
+import logging
 import unittest
 from mcp import types
 from mcp.shared.message import ClientMessageMetadata
 from mcp.shared.session import RequestResponder
 from reboot.aio.applications import Application
-from reboot.aio.tests import Reboot
-from reboot.mcp.client import connect, reconnect
 from reboot.mcp.server import DurableContext, DurableMCP
 from reboot.std.collections.v1.sorted_map import SortedMap
+from tests._mcp_test_case import McpTestCase
+
+logger = logging.getLogger(__name__)
 
 finish_event = asyncio.Event()
 
@@ -41,14 +44,7 @@ async def finish() -> None:
 application: Application = mcp.application()
 
 
-class TestSomething(unittest.IsolatedAsyncioTestCase):
-
-    async def asyncSetUp(self) -> None:
-        self.rbt = Reboot()
-        await self.rbt.start()
-
-    async def asyncTearDown(self) -> None:
-        await self.rbt.stop()
+class TestSomething(McpTestCase):
 
     async def test_mcp(self) -> None:
         revision = await self.rbt.up(application)
@@ -70,16 +66,16 @@ class TestSomething(unittest.IsolatedAsyncioTestCase):
             report_progress_event.set()
 
         last_event_id = None
+        token_event = asyncio.Event()
 
-        async with connect(
-            self.rbt.url() + "/mcp",
-            terminate_on_close=False,
+        async with self._mcp_session(
             message_handler=message_handler_expecting_no_messages,
         ) as (session, session_id, protocol_version):
 
             async def on_resumption_token_update(token: str) -> None:
                 nonlocal last_event_id
                 last_event_id = token
+                token_event.set()
 
             send_request_task = asyncio.create_task(
                 session.send_request(
@@ -103,21 +99,21 @@ class TestSomething(unittest.IsolatedAsyncioTestCase):
                 )
             )
 
-            while last_event_id == None:
-                await asyncio.sleep(0.01)
+            await token_event.wait()
 
             send_request_task.cancel()
-            try:
+            with contextlib.suppress(asyncio.CancelledError):
                 await send_request_task
-            except:
-                pass
 
-        print(f"Rebooting application running at {self.rbt.url()}...")
+        logger.debug(
+            "Rebooting application running at %s...",
+            self.rbt.url(),
+        )
 
         await self.rbt.down()
         await self.rbt.up(revision=revision)
 
-        print(f"... application now at {self.rbt.url()}")
+        logger.debug("... application now at %s", self.rbt.url())
 
         received_notification_event = asyncio.Event()
 
@@ -130,8 +126,7 @@ class TestSomething(unittest.IsolatedAsyncioTestCase):
                 if isinstance(message.root, types.ResourceListChangedNotification):
                     received_notification_event.set()
 
-        async with reconnect(
-            self.rbt.url() + "/mcp",
+        async with self._mcp_reconnect(
             session_id=session_id,
             protocol_version=protocol_version,
             # MCP bug: need to start using the "next" request ID in
@@ -175,7 +170,7 @@ class TestSomething(unittest.IsolatedAsyncioTestCase):
                 ),
             )
 
-            print(result)
+            logger.debug("Result: %s", result)
 
             await received_notification_event.wait()
 
@@ -185,7 +180,7 @@ class TestSomething(unittest.IsolatedAsyncioTestCase):
             )
 
             response = await SortedMap.ref("adds").range(context, limit=2)
-            print(response)
+            logger.debug("Response: %s", response)
 
 
 if __name__ == '__main__':
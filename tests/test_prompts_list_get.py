@@ -1,12 +1,10 @@
-import asyncio
+import logging
 import unittest
-from mcp import types
-from mcp.shared.message import ClientMessageMetadata
-from pydantic import AnyUrl
 from reboot.aio.applications import Application
-from reboot.aio.tests import Reboot
-from reboot.mcp.client import connect, reconnect
 from reboot.mcp.server import DurableMCP
+from tests._mcp_test_case import McpTestCase
+
+logger = logging.getLogger(__name__)
 
 # `DurableMCP` server which will handle HTTP requests at path "/mcp".
 mcp = DurableMCP(path="/mcp")
@@ -28,33 +26,29 @@ def greet_user(name: str, style: str = "friendly") -> str:
 application: Application = mcp.application()
 
 
-class TestSomething(unittest.IsolatedAsyncioTestCase):
-
-    async def asyncSetUp(self) -> None:
-        self.rbt = Reboot()
-        await self.rbt.start()
-
-    async def asyncTearDown(self) -> None:
-        await self.rbt.stop()
+class TestSomething(McpTestCase):
 
     async def test_mcp(self) -> None:
         revision = await self.rbt.up(application)
 
-        async with connect(
-            self.rbt.url() + "/mcp",
-            terminate_on_close=False,
-        ) as (session, session_id, protocol_version):
-            print(await session.list_prompts())
+        async with self._mcp_session() as (
+            session,
+            session_id,
+            protocol_version,
+        ):
+            logger.debug("Prompts: %s", await session.list_prompts())
 
-        print(f"Rebooting application running at {self.rbt.url()}...")
+        logger.debug(
+            "Rebooting application running at %s...",
+            self.rbt.url(),
+        )
 
         await self.rbt.down()
         await self.rbt.up(revision=revision)
 
-        print(f"... application now at {self.rbt.url()}")
+        logger.debug("... application now at %s", self.rbt.url())
 
-        async with reconnect(
-            self.rbt.url() + "/mcp",
+        async with self._mcp_reconnect(
             session_id=session_id,
             protocol_version=protocol_version,
             # MCP bug: need to start using the "next" request ID in
@@ -62,14 +56,15 @@ class TestSomething(unittest.IsolatedAsyncioTestCase):
             # modelcontextprotocol.io/specification/2025-06-18/basic#requests
             next_request_id=session._request_id,
         ) as session:
-            print(
+            logger.debug(
+                "Prompt: %s",
                 await session.get_prompt(
                     "greet_user",
                     arguments={
                         "name": "Alice",
                         "style": "friendly",
                     },
-                )
+                ),
             )
 
 
@@ -1,12 +1,12 @@
 import asyncio
+import logging
 import unittest
-from mcp import types
-from mcp.shared.message import ClientMessageMetadata
 from pydantic import AnyUrl
 from reboot.aio.applications import Application
-from reboot.aio.tests import Reboot
-from reboot.mcp.client import connect, reconnect
 from reboot.mcp.server import DurableMCP
+from tests._mcp_test_case import McpTestCase
+
+logger = logging.getLogger(__name__)
 
 # `DurableMCP` server which will handle HTTP requests at path "/mcp".
 mcp = DurableMCP(path="/mcp")
@@ -26,41 +26,42 @@ def get_settings() -> str:
 application: Application = mcp.application()
 
 
-class TestSomething(unittest.IsolatedAsyncioTestCase):
+SETTINGS_URL = AnyUrl("config://settings")
 
-    async def asyncSetUp(self) -> None:
-        self.rbt = Reboot()
-        await self.rbt.start()
 
-    async def asyncTearDown(self) -> None:
-        await self.rbt.stop()
+class TestSomething(McpTestCase):
 
     async def test_mcp(self) -> None:
         revision = await self.rbt.up(application)
 
-        async with connect(
-            self.rbt.url() + "/mcp",
-            terminate_on_close=False,
-        ) as (session, session_id, protocol_version):
-            resources = await session.list_resources()
-            templates = await session.list_resource_templates()
-            print("Resources:", resources)
-            print("Templates:", templates)
+        async with self._mcp_session() as (
+            session,
+            session_id,
+            protocol_version,
+        ):
+            resources, templates = await asyncio.gather(
+                session.list_resources(),
+                session.list_resource_templates(),
+            )
+            logger.debug("Resources: %s", resources)
+            logger.debug("Templates: %s", templates)
 
             # Verify fixed URI appears as regular resource, not template.
             assert len(resources.resources) == 1
-            assert resources.resources[0].uri == AnyUrl("config://settings")
+            assert resources.resources[0].uri == SETTINGS_URL
             assert len(templates.resourceTemplates) == 0
 
-        print(f"Rebooting application running at {self.rbt.url()}...")
+        logger.debug(
+            "Rebooting application running at %s...",
+            self.rbt.url(),
+        )
 
         await self.rbt.down()
         await self.rbt.up(revision=revision)
 
-        print(f"... application now at {self.rbt.url()}")
+        logger.debug("... application now at %s", self.rbt.url())
 
-        async with reconnect(
-            self.rbt.url() + "/mcp",
+        async with self._mcp_reconnect(
             session_id=session_id,
             protocol_version=protocol_version,
             # MCP bug: need to start using the "next" request ID in
@@ -68,8 +69,8 @@ class TestSomething(unittest.IsolatedAsyncioTestCase):
             # modelcontextprotocol.io/specification/2025-06-18/basic#requests
             next_request_id=session._request_id,
         ) as session:
-            result = await session.read_resource(AnyUrl("config://settings"))
-            print(result)
+            result = await session.read_resource(SETTINGS_URL)
+            logger.debug("Result: %s", result)
             assert len(result.contents) == 1
             assert "dark" in result.contents[0].text
 
@@ -1,12 +1,11 @@
-import asyncio
+import logging
 import unittest
-from mcp import types
-from mcp.shared.message import ClientMessageMetadata
 from pydantic import AnyUrl
 from reboot.aio.applications import Application
-from reboot.aio.tests import Reboot
-from reboot.mcp.client import connect, reconnect
 from reboot.mcp.server import DurableMCP
+from tests._mcp_test_case import McpTestCase
+
+logger = logging.getLogger(__name__)
 
 # `DurableMCP` server which will handle HTTP requests at path "/mcp".
 mcp = DurableMCP(path="/mcp")
@@ -22,33 +21,32 @@ def get_greeting(name: str) -> str:
 application: Application = mcp.application()
 
 
-class TestSomething(unittest.IsolatedAsyncioTestCase):
-
-    async def asyncSetUp(self) -> None:
-        self.rbt = Reboot()
-        await self.rbt.start()
-
-    async def asyncTearDown(self) -> None:
-        await self.rbt.stop()
+class TestSomething(McpTestCase):
 
     async def test_mcp(self) -> None:
         revision = await self.rbt.up(application)
 
-        async with connect(
-            self.rbt.url() + "/mcp",
-            terminate_on_close=False,
-        ) as (session, session_id, protocol_version):
-            print(await session.list_resource_templates())
-
-        print(f"Rebooting application running at {self.rbt.url()}...")
+        async with self._mcp_session() as (
+            session,
+            session_id,
+            protocol_version,
+        ):
+            logger.debug(
+                "Templates: %s",
+                await session.list_resource_templates(),
+            )
+
+        logger.debug(
+            "Rebooting application running at %s...",
+            self.rbt.url(),
+        )
 
         await self.rbt.down()
         await self.rbt.up(revision=revision)
 
-        print(f"... application now at {self.rbt.url()}")
+        logger.debug("... application now at %s", self.rbt.url())
 
-        async with reconnect(
-            self.rbt.url() + "/mcp",
+        async with self._mcp_reconnect(
             session_id=session_id,
             protocol_version=protocol_version,
             # MCP bug: need to start using the "next" request ID in
@@ -56,7 +54,10 @@ class TestSomething(unittest.IsolatedAsyncioTestCase):
             # modelcontextprotocol.io/specification/2025-06-18/basic#requests
             next_request_id=session._request_id,
         ) as session:
-            print(await session.read_resource(AnyUrl("greeting://World")))
+            logger.debug(
+                "Read result: %s",
+                await session.read_resource(AnyUrl("greeting://World")),
+            )
 
 
 if __name__ == '__main__':
@@ -1,9 +1,12 @@
+import asyncio
+import logging
 import unittest
 from pydantic import AnyUrl
 from reboot.aio.applications import Application
-from reboot.aio.tests import Reboot
-from reboot.mcp.client import connect
 from reboot.mcp.server import DurableContext, DurableMCP
+from tests._mcp_test_case import McpTestCase
+
+logger = logging.getLogger(__name__)
 
 # `DurableMCP` server which will handle HTTP requests at path "/mcp".
 mcp = DurableMCP(path="/mcp")
@@ -26,59 +29,47 @@ def template_no_params() -> str:
 application: Application = mcp.application()
 
 
-class TestTemplateReading(unittest.IsolatedAsyncioTestCase):
+# Resource URIs read by the tests below.
+NO_PARAMS_URL = AnyUrl("template://no-params")
+WITH_CONTEXT_URL = AnyUrl("template://with-context")
 
-    async def asyncSetUp(self) -> None:
-        self.rbt = Reboot()
-        await self.rbt.start()
 
-    async def asyncTearDown(self) -> None:
-        await self.rbt.stop()
+class TestTemplateReading(McpTestCase):
 
     async def test_template_list_and_read(self) -> None:
         """Verify that resources with context-only params work as templates."""
         revision = await self.rbt.up(application)
 
-        async with connect(
-            self.rbt.url() + "/mcp",
-            terminate_on_close=False,
-        ) as (session, session_id, protocol_version):
-            # Check resources/list (should be empty).
-            resources_result = await session.list_resources()
-            print(f"Resources: {resources_result}")
-
-            # Check resources/templates/list (should have our template).
-            templates_result = await session.list_resource_templates()
-            print(f"Templates: {templates_result}")
-            if templates_result.resourceTemplates:
+        async with self._mcp_session() as (session, _, _):
+            # Check resources/list (should be empty) and
+            # resources/templates/list (should have our template).
+            resources_result, templates_result = await asyncio.gather(
+                session.list_resources(),
+                session.list_resource_templates(),
+            )
+            logger.debug("Resources: %s", resources_result)
+            logger.debug("Templates: %s", templates_result)
+            if logger.isEnabledFor(logging.DEBUG):
                 for template in templates_result.resourceTemplates:
-                    print(
-                        f"Template: name={template.name}, uriTemplate={template.uriTemplate}"
+                    logger.debug(
+                        "Template: name=%s, uriTemplate=%s",
+                        template.name,
+                        template.uriTemplate,
                     )
 
             # Try to read the resource with no params (should work as regular resource).
-            print("\nReading template://no-params...")
-            try:
-                read_result = await session.read_resource(
-                    AnyUrl("template://no-params")
-                )
-                print(f"Read result (no-params): {read_result}")
-                assert len(read_result.contents) == 1
-                assert "no-params-data" in read_result.contents[0].text
-            except Exception as e:
-                print(f"Failed to read no-params: {e}")
+            logger.debug("Reading template://no-params...")
+            read_result = await session.read_resource(NO_PARAMS_URL)
+            logger.debug("Read result (no-params): %s", read_result)
+            assert len(read_result.contents) == 1
+            assert read_result.contents[0].text == "no-params-data"
 
             # Try to read the template with context param.
-            print("\nReading template://with-context...")
-            try:
-                read_result = await session.read_resource(
-                    AnyUrl("template://with-context")
-                )
-                print(f"Read result (with-context): {read_result}")
-                assert len(read_result.contents) == 1
-                assert "with-context-data" in read_result.contents[0].text
-            except Exception as e:
-                print(f"Failed to read with-context: {e}")
+            logger.debug("Reading template://with-context...")
+            read_result = await session.read_resource(WITH_CONTEXT_URL)
+            logger.debug("Read result (with-context): %s", read_result)
+            assert len(read_result.contents) == 1
+            assert read_result.contents[0].text == "with-context-data"
 
 
 if __name__ == '__main__':